@@ -1,17 +1,31 @@
+import concurrent.futures
 import getpass
 import json
+import threading
 import keyring
-import urllib.request
+from .http_handler import HttpError, session
 from .output_handler import print_error, print_success
 
 AUTH_LOGIN_API_URL="https://prospect-api.versyx.net/api/auth/login"
 AUTH_REFRESH_API_URL="https://prospect-api.versyx.net/api/auth/refresh"
 CREDENTIAL_SERVICE_NAME = "ProspectorDeviceProfilingService"
 
+# Process-local token cache. Each credential-manager read is a blocking
+# DPAPI round-trip, so tokens are cached on first read and the cache is
+# kept in sync whenever a token is stored. The lock guards the dict
+# against concurrent readers/writers (prefetch_tokens and the profile
+# upload run on worker threads).
+_token_cache = {}
+_token_cache_lock = threading.Lock()
+
 def get_token_from_credential_manager(token_type: str) -> str:
     """
     Retrieves a token from the system's credential manager.
 
+    Tokens are cached in-process after the first read, so repeated lookups
+    (e.g. the 401 retry path in send_profile) avoid further credential
+    manager round-trips.
+
     Args:
         token_type (str): The type of token to retrieve (e.g., "AccessToken" or "RefreshToken").
 
@@ -22,8 +36,16 @@ def get_token_from_credential_manager(token_type: str) -> str:
         Exception: If an error occurs while accessing the credential manager.
     """
 
+    with _token_cache_lock:
+        if token_type in _token_cache:
+            return _token_cache[token_type]
+
     try:
-        return keyring.get_password(f"{CREDENTIAL_SERVICE_NAME}/{token_type}", token_type)
+        token = keyring.get_password(f"{CREDENTIAL_SERVICE_NAME}/{token_type}", token_type)
+        if token is not None:
+            with _token_cache_lock:
+                _token_cache[token_type] = token
+        return token
     except Exception as e:
         print_error(f"Failed to get {token_type} from credential manager: {e}")
     return None
@@ -46,11 +68,28 @@ def set_token_in_credential_manager(token_type: str, token: str) -> None:
 
     try:
         keyring.set_password(f"{CREDENTIAL_SERVICE_NAME}/{token_type}", token_type, token)
+        with _token_cache_lock:
+            _token_cache[token_type] = token
         print_success(f"{token_type} saved to credential manager.")
     except Exception as e:
         print_error(f"Failed to save {token_type} to credential manager: {e}")
 
 
+def invalidate_cached_token(token_type: str) -> None:
+    """
+    Drops a token from the process-local cache.
+
+    Called when the service rejects a token (e.g. a 401 on upload) so the
+    stale value is not served to subsequent lookups.
+
+    Args:
+        token_type (str): The type of token to invalidate (e.g., "AccessToken").
+    """
+
+    with _token_cache_lock:
+        _token_cache.pop(token_type, None)
+
+
 def authenticate_user(username: str, password: str) -> str:
     """
     Authenticates the user and obtains an access token and a refresh token.
@@ -63,7 +102,7 @@ def authenticate_user(username: str, password: str) -> str:
         dict: The authentication response containing tokens.
 
     Raises:
-        urllib.error.HTTPError: If an HTTP error occurs during authentication.
+        HttpError: If an HTTP error occurs during authentication.
         Exception: If an unexpected error occurs during authentication.
     """
 
@@ -73,16 +112,15 @@ def authenticate_user(username: str, password: str) -> str:
             'password': password
         }).encode("utf-8")
 
-        login_request = urllib.request.Request(AUTH_LOGIN_API_URL)
-        login_request.add_header('Content-Type', 'application/json; charset=utf-8')
-        login_request.add_header('Content-Length', len(login_data))
-
-        with urllib.request.urlopen(login_request, login_data) as response:
-            response_data = json.load(response)
-            print_success(f"Successfully authenticated with prospector service at {AUTH_LOGIN_API_URL}")
+        response_data = json.loads(session.post(
+            AUTH_LOGIN_API_URL,
+            login_data,
+            {'Content-Type': 'application/json; charset=utf-8'}
+        ))
+        print_success(f"Successfully authenticated with prospector service at {AUTH_LOGIN_API_URL}")
 
-            return response_data
-    except urllib.error.HTTPError as e:
+        return response_data
+    except HttpError as e:
         print_error(f"Failed to get access token: {e}")
         raise
     except Exception as e:
@@ -101,7 +139,7 @@ def refresh_access_token(refresh_token: str) -> dict:
         dict: The authentication response containing new tokens.
 
     Raises:
-        urllib.error.HTTPError: If an HTTP error occurs during token refresh.
+        HttpError: If an HTTP error occurs during token refresh.
         Exception: If an unexpected error occurs during token refresh.
     """
     try:
@@ -109,16 +147,15 @@ def refresh_access_token(refresh_token: str) -> dict:
             'refresh_token': refresh_token
         }).encode("utf-8")
 
-        refresh_request = urllib.request.Request(AUTH_REFRESH_API_URL)
-        refresh_request.add_header('Content-Type', 'application/json; charset=utf-8')
-        refresh_request.add_header('Content-Length', len(refresh_data))
-
-        with urllib.request.urlopen(refresh_request, refresh_data) as response:
-            response_data = json.load(response)
-            print_success(f"Successfully refreshed access token with prospector service at {AUTH_REFRESH_API_URL}")
+        response_data = json.loads(session.post(
+            AUTH_REFRESH_API_URL,
+            refresh_data,
+            {'Content-Type': 'application/json; charset=utf-8'}
+        ))
+        print_success(f"Successfully refreshed access token with prospector service at {AUTH_REFRESH_API_URL}")
 
-            return response_data
-    except urllib.error.HTTPError as e:
+        return response_data
+    except HttpError as e:
         print_error(f"Failed to refresh access token: {e}")
         raise
     except Exception as e:
@@ -126,6 +163,20 @@ def refresh_access_token(refresh_token: str) -> dict:
         raise
 
 
+def prefetch_tokens() -> None:
+    """
+    Fetches the access and refresh tokens from the credential manager concurrently.
+
+    Each credential-manager read is a blocking round-trip, so fetching both
+    tokens in parallel warms the token cache in roughly the latency of a
+    single read. Later calls to get_access_token and the 401 retry path in
+    send_profile are then served from the cache.
+    """
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(get_token_from_credential_manager, ["AccessToken", "RefreshToken"]))
+
+
 def get_access_token():
     """
     Retrieves the access token from the credential manager or prompts for user credentials to obtain a
@@ -0,0 +1,120 @@
+import http.client
+import urllib.parse
+
+
+class HttpError(Exception):
+    """
+    Raised when the prospector service responds with an HTTP error status.
+
+    Attributes:
+        url (str): The URL that was requested.
+        code (int): The HTTP status code returned by the service.
+        reason (str): The HTTP reason phrase returned by the service.
+    """
+
+    def __init__(self, url: str, code: int, reason: str):
+        super().__init__(f"HTTP Error {code}: {reason}")
+        self.url = url
+        self.code = code
+        self.reason = reason
+
+
+class HttpSession:
+    """
+    A keep-alive HTTPS session that reuses one connection per host.
+
+    Opening a fresh TCP + TLS connection per request costs a full handshake
+    each time. The login, refresh, and profile endpoints all live on the same
+    host, so reusing a single pooled connection means only the first request
+    pays the handshake; subsequent requests (including the 401 retry path)
+    reuse the established socket and TLS session.
+    """
+
+    def __init__(self, timeout: int = 30):
+        self._connections = {}
+        self._timeout = timeout
+
+    def _get_connection(self, host: str) -> http.client.HTTPSConnection:
+        """
+        Returns the cached connection for a host, creating it if necessary.
+
+        Args:
+            host (str): The host (netloc) to connect to.
+
+        Returns:
+            http.client.HTTPSConnection: The pooled connection.
+        """
+
+        connection = self._connections.get(host)
+        if connection is None:
+            connection = http.client.HTTPSConnection(host, timeout=self._timeout)
+            self._connections[host] = connection
+
+        return connection
+
+    def _drop_connection(self, host: str) -> None:
+        """
+        Closes and discards the cached connection for a host.
+
+        Args:
+            host (str): The host (netloc) whose connection should be dropped.
+        """
+
+        connection = self._connections.pop(host, None)
+        if connection is not None:
+            connection.close()
+
+    def post(self, url: str, data: bytes, headers: dict) -> bytes:
+        """
+        Sends a POST request over the pooled connection for the URL's host.
+
+        The Content-Length header is set automatically by http.client. If the
+        server closed an idle keep-alive connection, the request is retried
+        once on a fresh connection.
+
+        Args:
+            url (str): The URL to POST to.
+            data (bytes): The request body.
+            headers (dict): The request headers.
+
+        Returns:
+            bytes: The response body.
+
+        Raises:
+            HttpError: If the service responds with a 4xx or 5xx status.
+            OSError: If the connection fails after a retry.
+        """
+
+        parsed = urllib.parse.urlsplit(url)
+        path = parsed.path or '/'
+        if parsed.query:
+            path += '?' + parsed.query
+
+        for attempt in range(2):
+            connection = self._get_connection(parsed.netloc)
+            try:
+                connection.request('POST', path, body=data, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, ConnectionError, OSError):
+                # Stale keep-alive connections fail on reuse; retry once fresh.
+                self._drop_connection(parsed.netloc)
+                if attempt:
+                    raise
+                continue
+
+            if response.status >= 400:
+                raise HttpError(url, response.status, response.reason)
+
+            return body
+
+    def close(self) -> None:
+        """
+        Closes all pooled connections.
+        """
+
+        for host in list(self._connections):
+            self._drop_connection(host)
+
+
+session = HttpSession()
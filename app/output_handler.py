@@ -1,5 +1,10 @@
-import logging
-import re
+import functools
+import sys
+
+# Bound once so each message is a single write call; going through the
+# logging module would build a LogRecord, filter, format, and lock per
+# message for output that is just a labelled line on stderr.
+_write = sys.stderr.write
 
 
 class Terminal:
@@ -18,7 +23,7 @@ def print_success(message: str) -> None:
         message (str): The success message to print.
     """
 
-    logging.info(f"{Terminal.GREEN}[success]{Terminal.RESET} {Terminal.WHITE}{message}{Terminal.RESET}")
+    _write(f"{Terminal.GREEN}[success]{Terminal.RESET} {Terminal.WHITE}{message}{Terminal.RESET}\n")
 
 
 def print_error(message: str) -> None:
@@ -29,7 +34,7 @@ def print_error(message: str) -> None:
         message (str): The error message to print.
     """
 
-    logging.error(f"{Terminal.RED}[error]{Terminal.RESET} {Terminal.WHITE}{message}{Terminal.RESET}")
+    _write(f"{Terminal.RED}[error]{Terminal.RESET} {Terminal.WHITE}{message}{Terminal.RESET}\n")
 
 
 def print_info(message) -> None:
@@ -39,18 +44,29 @@ def print_info(message) -> None:
     Args:
         message (str): The informational message to print.
     """
-    logging.info(f"{Terminal.BLUE}[info]{Terminal.RESET} {Terminal.WHITE}{message}{Terminal.RESET}")
+    _write(f"{Terminal.BLUE}[info]{Terminal.RESET} {Terminal.WHITE}{message}{Terminal.RESET}\n")
 
 
-def to_snake_case(str: str) -> str:
+@functools.lru_cache(maxsize=128)
+def to_snake_case(value: str) -> str:
     """
     Converts a CamelCase string to snake_case.
 
+    A plain character scan beats the regex engine on the short ASCII field
+    names this is used for, and results are memoized since callers convert
+    the same small set of names repeatedly.
+
     Args:
-        str (str): The string to convert.
+        value (str): The string to convert.
 
     Returns:
         str: The converted string in snake_case.
     """
 
-    return re.sub(r'(?<!^)(?=[A-Z])', '_', str).lower()
+    chars = []
+    for i, char in enumerate(value):
+        if char.isupper() and i:
+            chars.append('_')
+        chars.append(char.lower())
+
+    return ''.join(chars)
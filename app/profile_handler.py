@@ -1,59 +1,177 @@
+import concurrent.futures
+import gzip
+import hashlib
+import itertools
 import json
 import os
 import platform
-import urllib.request
+import struct
+import time
 import winreg
-from .system_metrics import get_hwid, get_disks, get_memory, get_gpus, \
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from .system_metrics import get_hwid, get_cpu, get_disks, get_memory, get_gpus, \
     get_bios, get_distribution, get_uptime, get_user, get_software, \
-    get_network_interfaces,  get_connected_wifi
+    get_software_last_write, get_network_interfaces,  get_connected_wifi
 from .auth_handler import get_token_from_credential_manager, set_token_in_credential_manager, \
-    refresh_access_token
+    refresh_access_token, invalidate_cached_token
+from .http_handler import HttpError, session
 from .output_handler import print_error, print_info, print_success
 
 
 PROFILE_API_URL="https://prospect-api.versyx.net/api/device"
 
+# How long a previously written profile file is trusted before a full
+# rescan. Hardware and installed software rarely change run-to-run, so
+# within this window only the volatile fields are recollected.
+PROFILE_CACHE_TTL = 3600
+
+# Seconds between the FILETIME epoch (1601) and the Unix epoch (1970),
+# for comparing registry last-write times against file mtimes.
+_FILETIME_EPOCH_OFFSET = 11644473600
+
+# platform/os values that cannot change while the process runs, computed
+# once at import. The architecture comes from the interpreter's pointer
+# size, which is free; platform.architecture() can inspect the executable
+# or spawn a subprocess on some interpreter builds.
+_HOSTNAME = platform.node()
+_OS_PLATFORM = platform.system()
+_OS_ARCH = f"{struct.calcsize('P') * 8}bit"
+_OS_VERSION = platform.version()
 
-def get_profile() -> dict:
+
+def _profile_destination(hwid: str) -> Path:
+    """
+    Returns the path of the on-disk profile file for a hardware ID.
+
+    Args:
+        hwid (str): The device hardware ID hash.
+
+    Returns:
+        Path: The absolute path of the profile file.
+    """
+
+    return Path.home() / '.prospector' / ('prospector-profile-' + hwid[:8] + '.json')
+
+
+def _load_cached_profile() -> dict:
+    """
+    Loads the previously written profile if it is recent enough to reuse.
+
+    The expensive sections (hardware, software) are taken as-is from the
+    cached file while the cheap volatile fields (user, uptime, Wi-Fi) are
+    recollected, so a rerun within the TTL costs milliseconds instead of a
+    full registry and subprocess scan.
+
+    Returns:
+        dict: The cached device profile with volatile fields refreshed, or
+              None if no usable cache exists.
+    """
+
+    try:
+        destination = _profile_destination(get_hwid())
+        if not destination.is_file():
+            return None
+        mtime = destination.stat().st_mtime
+        if time.time() - mtime > PROFILE_CACHE_TTL:
+            return None
+
+        # Installs and uninstalls bump the Uninstall keys' last-write
+        # FILETIME; if that postdates the cached file, the software
+        # inventory is stale regardless of the TTL.
+        last_write = get_software_last_write()
+        if last_write and last_write / 10**7 - _FILETIME_EPOCH_OFFSET > mtime:
+            return None
+
+        profile = json.loads(destination.read_bytes())
+
+        profile['user'] = get_user()
+        profile['uptime'] = get_uptime()
+        profile['network']['wifi'] = get_connected_wifi()
+
+        print_info(f"Reusing cached device profile from {destination}")
+        return profile
+    except Exception:
+        return None
+
+
+def get_profile(force: bool = False) -> dict:
     """
     Gathers device profile information, including hardware, software, and OS details.
 
+    A profile written within the last hour is reused with only its volatile
+    fields refreshed; pass force=True (the --force CLI flag) to rescan
+    everything. The individual collectors are I/O-bound (subprocesses,
+    registry round-trips), so they run concurrently on a thread pool and the
+    profile is assembled from their results; total collection time approaches
+    that of the slowest probe rather than the sum of all of them.
+
+    Args:
+        force (bool): Whether to bypass the cached profile and rescan.
+
     Returns:
         dict: A dictionary containing the device profile.
     """
 
-    installed_software = get_software(
-        winreg.HKEY_LOCAL_MACHINE, winreg.KEY_WOW64_32KEY
-    ) + get_software(
-        winreg.HKEY_LOCAL_MACHINE, winreg.KEY_WOW64_64KEY
-    ) + get_software(
-        winreg.HKEY_CURRENT_USER, 0
-    )
+    if not force:
+        cached = _load_cached_profile()
+        if cached is not None:
+            return cached
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {
+            'hwid': executor.submit(get_hwid),
+            'user': executor.submit(get_user),
+            'uptime': executor.submit(get_uptime),
+            'distribution': executor.submit(get_distribution),
+            'cpu': executor.submit(get_cpu),
+            'bios': executor.submit(get_bios),
+            'ram': executor.submit(get_memory),
+            'disks': executor.submit(get_disks),
+            'gpus': executor.submit(get_gpus),
+            'wifi': executor.submit(get_connected_wifi),
+            'interfaces': executor.submit(get_network_interfaces),
+            'software_32': executor.submit(get_software, winreg.HKEY_LOCAL_MACHINE, winreg.KEY_WOW64_32KEY),
+            'software_64': executor.submit(get_software, winreg.HKEY_LOCAL_MACHINE, winreg.KEY_WOW64_64KEY),
+            'software_user': executor.submit(get_software, winreg.HKEY_CURRENT_USER, 0),
+        }
+        results = {name: future.result() for name, future in futures.items()}
+
+    # The WOW64 views list many of the same programs; keying on
+    # (name, version) drops the duplicates before they inflate the
+    # serialized payload.
+    installed_software = list({
+        (entry['name'], entry['version']): entry
+        for entry in itertools.chain(
+            results['software_32'], results['software_64'], results['software_user']
+        )
+    }.values())
 
     profile = {
-        'hwid': get_hwid(),
-        'hostname': platform.node(),
-        'user': get_user(),
-        'uptime': get_uptime(),
+        'hwid': results['hwid'],
+        'hostname': _HOSTNAME,
+        'user': results['user'],
+        'uptime': results['uptime'],
         'os': {
-            'platform': platform.system(),
-            'distribution': get_distribution(),
-            'arch': platform.architecture()[0],
-            'version': platform.version(),
+            'platform': _OS_PLATFORM,
+            'distribution': results['distribution'],
+            'arch': _OS_ARCH,
+            'version': _OS_VERSION,
         },
         'hardware': {
-            'bios': get_bios(),
-            'cpu': {
-                'name': platform.processor(),
-                'cores': os.cpu_count(),
-            },
-            'ram': get_memory(),
-            'disks': get_disks(),
-            'gpus': get_gpus()
+            'bios': results['bios'],
+            'cpu': results['cpu'],
+            'ram': results['ram'],
+            'disks': results['disks'],
+            'gpus': results['gpus']
         },
         'network': {
-            'wifi': get_connected_wifi(),
-            'interfaces': get_network_interfaces()
+            'wifi': results['wifi'],
+            'interfaces': results['interfaces']
         },
         'software': {
             'programs': installed_software,
@@ -65,54 +183,165 @@ def get_profile() -> dict:
     return profile
 
 
-def write_profile(profile: dict) -> None:
+def serialize_profile(profile: dict, pretty: bool = False) -> bytes:
+    """
+    Serializes a device profile to JSON bytes.
+
+    Each representation is encoded exactly once by the caller and the bytes
+    are shared between the file writer and the service upload, instead of
+    every consumer re-walking the profile dict.
+
+    Args:
+        profile (dict): The device profile to serialize.
+        pretty (bool): Whether to indent the output for human readers.
+
+    Returns:
+        bytes: The encoded JSON document.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(profile, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(profile, sort_keys=False, indent=4).encode('utf-8')
+
+    return json.dumps(profile, separators=(',', ':')).encode('utf-8')
+
+
+def _last_hash_path() -> Path:
+    """
+    Returns the path of the file recording the last submitted profile's hash.
+
+    Returns:
+        Path: The absolute path of the hash file.
     """
-    Writes the device profile to a JSON file in the user's home directory.
+
+    return Path.home() / '.prospector' / '.last_hash'
+
+
+def _stable_profile_digest(profile: dict) -> bytes:
+    """
+    Hashes the profile with its volatile fields blanked.
+
+    Uptime, the logged-in user, and the Wi-Fi details differ between runs
+    without the device meaningfully changing (the same fields the cache
+    loader refreshes), so they are excluded from the digest used to detect
+    no-op runs.
 
     Args:
-        profile (dict): The device profile to write.
+        profile (dict): The device profile to digest.
+
+    Returns:
+        bytes: The SHA-256 digest of the stable portion of the profile.
     """
 
-    filename = 'prospector-profile-' + profile.get('hwid')[:8] + '.json'
-    filepath = os.path.join(os.path.expanduser('~'), '.prospector')
+    stable = dict(profile, uptime=None, user=None)
+    stable['network'] = dict(profile['network'], wifi=None)
 
-    if not os.path.isdir(filepath):
-        os.mkdir(filepath)
+    return hashlib.sha256(serialize_profile(stable)).digest()
 
-    content = json.dumps(profile, sort_keys=False, indent=4)
-    destination = os.path.join(filepath, filename)
+
+def profile_unchanged(profile: dict) -> bool:
+    """
+    Returns whether the profile matches the one recorded by the last run.
+
+    Args:
+        profile (dict): The freshly collected device profile.
+
+    Returns:
+        bool: True if the stable portion of the profile hashes identically
+              to the recorded digest and the profile file still exists,
+              False otherwise.
+    """
 
     try:
-        with open(destination, 'w') as prospectorfile:
-            prospectorfile.write(content)
-            print_success(f"Wrote new device profile to {destination}")
+        # A matching digest with a deleted profile file still needs a
+        # rewrite, so the file's presence is part of "unchanged".
+        if not _profile_destination(profile['hwid']).is_file():
+            return False
+
+        return _last_hash_path().read_bytes() == _stable_profile_digest(profile)
+    except OSError:
+        return False
+
+
+def remember_profile_hash(profile: dict) -> None:
+    """
+    Records the profile's digest for change detection on the next run.
+
+    Only called once the service has accepted the upload — recording any
+    earlier would make later runs skip the send and silently starve the
+    service. The digest is written to a temporary file and moved into place
+    with os.replace so a concurrent or interrupted run never sees a partial
+    hash.
+
+    Args:
+        profile (dict): The device profile that was successfully sent.
+    """
+
+    try:
+        destination = _last_hash_path()
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = destination.with_suffix('.tmp')
+        temp_path.write_bytes(_stable_profile_digest(profile))
+        os.replace(temp_path, destination)
+    except OSError as e:
+        print_error(f"Failed to record profile hash: {e}")
+
+
+def write_profile(payload: bytes, hwid: str) -> None:
+    """
+    Writes the serialized device profile to a JSON file in the user's home directory.
+
+    Args:
+        payload (bytes): The serialized device profile.
+        hwid (str): The device hardware ID hash, used to name the file.
+    """
+
+    destination = _profile_destination(hwid)
+
+    try:
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        destination.write_bytes(payload)
+        print_success(f"Wrote new device profile to {destination}")
     except Exception as e:
         print_error(f"Failed to write new device profile: {e}")
 
 
-def send_profile(access_token: str, profile: dict) -> None:
+def send_profile(access_token: str, payload: bytes) -> None:
     """
-    Sends the device profile to the prosector service.
+    Sends the serialized device profile to the prosector service.
+
+    On a 401 the access token is refreshed and the request retried once,
+    reusing the already-compressed body instead of recursing and redoing
+    the serialization work.
 
     Args:
-        profile (dict): The device profile to send.
+        access_token (str): The access token for the prospector service.
+        payload (bytes): The compact serialized device profile.
     """
 
-    try:
-        profile_data = json.dumps(profile, sort_keys=False, indent=4).encode('utf-8')
+    # The software list makes the JSON highly repetitive, so gzip
+    # typically shrinks the body several-fold before it hits the wire.
+    profile_data = gzip.compress(payload)
 
-        profile_request = urllib.request.Request(PROFILE_API_URL)
-        profile_request.add_header('Content-Type', 'application/json; charset=utf-8')
-        profile_request.add_header('Authorization', f'Bearer {access_token}')
-        profile_request.add_header('Content-Length', len(profile_data))
+    for attempt in range(2):
+        try:
+            session.post(PROFILE_API_URL, profile_data, {
+                'Content-Type': 'application/json; charset=utf-8',
+                'Content-Encoding': 'gzip',
+                'Authorization': f'Bearer {access_token}'
+            })
 
-        urllib.request.urlopen(profile_request, profile_data)
+            print_success(f"Submitted device profile to prospector service at {PROFILE_API_URL}")
+            return
+        except HttpError as e:
+            if e.code != 401 or attempt > 0:
+                print_error(f"Failed to send device profile to profile service: {e}")
+                raise
 
-        print_success(f"Submitted device profile to prospector service at {PROFILE_API_URL}")
-    except urllib.error.HTTPError as e:
-        if e.code == 401:
             print_info(f"Access token expired. Refreshing token...")
 
+            invalidate_cached_token("AccessToken")
             refresh_token = get_token_from_credential_manager("RefreshToken")
             if not refresh_token:
                 print_error("Refresh token not found. Please authenticate again.")
@@ -123,11 +352,8 @@ def send_profile(access_token: str, profile: dict) -> None:
             set_token_in_credential_manager("RefreshToken", auth_response['refresh_token'])
 
             # Retry sending the profile with the new access token
-            send_profile(auth_response['access_token'], profile)
-        else:
-            print_error(f"Failed to send device profile to profile service: {e}")
+            access_token = auth_response['access_token']
+        except Exception as e:
+            print_error(f"Unexpected error during profile submission: {e}")
             raise
-    except Exception as e:
-        print_error(f"Unexpected error during profile submission: {e}")
-        raise
 
@@ -1,7 +1,28 @@
 
+import functools
 import winreg
 from .output_handler import print_error
 
+
+@functools.lru_cache(maxsize=4)
+def connect_hive(hive) -> winreg.HKEYType:
+    """
+    Returns a cached connection to a registry hive.
+
+    Each winreg.ConnectRegistry call is a round-trip to the local registry
+    service, so connections are established once per hive and reused for
+    every subsequent key open.
+
+    Args:
+        hive: The registry hive (e.g., winreg.HKEY_LOCAL_MACHINE).
+
+    Returns:
+        winreg.HKEYType: The connected hive handle.
+    """
+
+    return winreg.ConnectRegistry(None, hive)
+
+
 def open_reg_key(hive, path, create=False) -> winreg.HKEYType:
     """
     Opens a registry key.
@@ -21,7 +42,7 @@ def open_reg_key(hive, path, create=False) -> winreg.HKEYType:
             permissions |= winreg.KEY_WRITE | winreg.KEY_CREATE_SUB_KEY
 
         return winreg.OpenKey(
-            winreg.ConnectRegistry(None, hive),
+            connect_hive(hive),
             path,
             0,
             permissions
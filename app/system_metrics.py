@@ -1,16 +1,103 @@
 
 import ctypes
+import functools
 import getpass
 import hashlib
+import json
 import os
-import re
 import socket
 import subprocess
+import threading
+import uuid
 import winreg
-from .registry_handler import open_reg_key
-from .output_handler import print_error, to_snake_case
+import xml.etree.ElementTree
+from .registry_handler import connect_hive, open_reg_key
+from .output_handler import print_error
+
+
+# PowerShell script that collects every CIM class the profile needs in one
+# subprocess. Spawning wmic per class pays process-launch plus WMI
+# initialization each time (hundreds of ms); batching amortizes that cost
+# down to a single launch and returns structured JSON instead of the
+# whitespace-delimited text wmic emits.
+_CIM_BATCH_SCRIPT = (
+    "@{"
+    "memory = @(Get-CimInstance Win32_PhysicalMemory | "
+    "Select-Object DeviceLocator,Capacity,ConfiguredClockSpeed,DataWidth,Manufacturer,PartNumber); "
+    "disks = @(Get-CimInstance Win32_DiskDrive | "
+    "Select-Object Model,Size,MediaType,SerialNumber,Status); "
+    "gpus = @(Get-CimInstance Win32_VideoController | "
+    "Select-Object Name,DriverVersion,Status); "
+    "nics = @(Get-CimInstance Win32_NetworkAdapter | "
+    "Select-Object Name,MACAddress,Speed,Manufacturer,Description); "
+    "product = Get-CimInstance Win32_ComputerSystemProduct | Select-Object UUID"
+    "} | ConvertTo-Json -Depth 4 -Compress"
+)
+
+
+# Cache for the batched CIM collection. lru_cache does not serialize
+# concurrent first calls, and the CIM-backed collectors all land on the
+# thread pool at once on a cold run, so the launch is guarded by a lock
+# with a double-checked read to keep it to one subprocess.
+_cim_cache = None
+_cim_lock = threading.Lock()
+
+
+def _collect_cim() -> dict:
+    """
+    Collects all CIM-backed hardware information in a single PowerShell call.
+
+    The result is cached for the lifetime of the process, so the individual
+    get_* collectors share one subprocess launch between them even when
+    they race on the first call.
+
+    Returns:
+        dict: A dictionary keyed by section name ('memory', 'disks', 'gpus',
+              'nics', 'product'), each holding the raw CIM instances.
+
+    Raises:
+        Exception: If the PowerShell invocation or JSON parsing fails.
+    """
+
+    global _cim_cache
 
+    if _cim_cache is None:
+        with _cim_lock:
+            if _cim_cache is None:
+                output = subprocess.check_output(
+                    ['powershell', '-NoProfile', '-NonInteractive', '-Command', _CIM_BATCH_SCRIPT],
+                    creationflags=subprocess.CREATE_NO_WINDOW,
+                    timeout=60
+                )
+                _cim_cache = json.loads(output)
+
+    return _cim_cache
+
+
+def _cim_instances(section: str) -> list:
+    """
+    Returns the CIM instances for a section of the batched collection.
+
+    ConvertTo-Json unwraps single-element arrays, so a lone instance is
+    normalized back into a one-element list.
+
+    Args:
+        section (str): The section name (e.g., 'memory' or 'disks').
 
+    Returns:
+        list: The CIM instances for the section.
+    """
+
+    instances = _collect_cim().get(section)
+    if instances is None:
+        return []
+    if isinstance(instances, dict):
+        return [instances]
+
+    return instances
+
+
+@functools.lru_cache(maxsize=1)
 def get_bios() -> dict:
     """
     Retrieves BIOS information from the Windows registry.
@@ -20,13 +107,15 @@ def get_bios() -> dict:
     """
 
     try:
-        reg_key = open_reg_key(winreg.HKEY_LOCAL_MACHINE, r"HARDWARE\DESCRIPTION\System")
-        reg_key_b = open_reg_key(winreg.HKEY_LOCAL_MACHINE, r"HARDWARE\DESCRIPTION\System\BIOS")
-        version = winreg.QueryValueEx(reg_key, "SystemBiosVersion")
-        model = [
-            winreg.QueryValueEx(reg_key_b, "BaseBoardManufacturer")[0],
-            winreg.QueryValueEx(reg_key_b, "BaseBoardProduct")[0]
-        ]
+        # BIOS is a subkey of System, so open it relative to the already
+        # opened parent instead of resolving the full path twice.
+        sys_key = open_reg_key(winreg.HKEY_LOCAL_MACHINE, r"HARDWARE\DESCRIPTION\System")
+        version = winreg.QueryValueEx(sys_key, "SystemBiosVersion")
+        with winreg.OpenKey(sys_key, "BIOS") as bios_key:
+            model = [
+                winreg.QueryValueEx(bios_key, "BaseBoardManufacturer")[0],
+                winreg.QueryValueEx(bios_key, "BaseBoardProduct")[0]
+            ]
 
         return {
             'model': ' '.join(model),
@@ -37,6 +126,41 @@ def get_bios() -> dict:
         return {}
 
 
+# The three registry views an installed program can be recorded under.
+_UNINSTALL_KEY_PATH = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"
+_UNINSTALL_VIEWS = (
+    (winreg.HKEY_LOCAL_MACHINE, winreg.KEY_WOW64_32KEY),
+    (winreg.HKEY_LOCAL_MACHINE, winreg.KEY_WOW64_64KEY),
+    (winreg.HKEY_CURRENT_USER, 0),
+)
+
+
+def get_software_last_write() -> int:
+    """
+    Returns the newest last-write timestamp across the Uninstall keys.
+
+    The registry stamps a key's last-write FILETIME whenever a program is
+    installed or removed under it, so this single value is a cheap
+    invalidation signal for a cached software inventory — three
+    QueryInfoKey calls instead of a full subkey walk.
+
+    Returns:
+        int: The newest last-write FILETIME (100 ns intervals since 1601)
+             across the three Uninstall views, or 0 if none could be read.
+    """
+
+    last_write = 0
+    for hive, flag in _UNINSTALL_VIEWS:
+        try:
+            with winreg.OpenKey(connect_hive(hive), _UNINSTALL_KEY_PATH, 0,
+                                winreg.KEY_READ | flag) as reg_key:
+                last_write = max(last_write, winreg.QueryInfoKey(reg_key)[2])
+        except OSError:
+            continue
+
+    return last_write
+
+
 def get_software(hive, flag) -> list:
     """
     Retrieves a list of installed software from the Windows registry.
@@ -50,30 +174,47 @@ def get_software(hive, flag) -> list:
     """
 
     try:
-        reg_key = winreg.OpenKey(
-            winreg.ConnectRegistry(None, hive),
-            r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall",
+        software_list = []
+        # Context managers close every handle even when a subkey vanishes
+        # mid-walk; without them each skipped entry leaked its handle
+        # until garbage collection.
+        with winreg.OpenKey(
+            connect_hive(hive),
+            _UNINSTALL_KEY_PATH,
             0,
             winreg.KEY_READ | flag
-        )
-        count_subkey = winreg.QueryInfoKey(reg_key)[0]
-        software_list = []
-        for i in range(count_subkey):
-            software = {}
-            try:
-                sub_key = winreg.OpenKey(reg_key, winreg.EnumKey(reg_key, i))
-                software['name'] = winreg.QueryValueEx(sub_key, "DisplayName")[0]
+        ) as reg_key:
+            # Enumerate until EnumKey runs off the end rather than trusting
+            # a QueryInfoKey count taken before the walk; entries added or
+            # removed mid-walk no longer skip or double-read an index.
+            i = 0
+            while True:
                 try:
-                    software['version'] = winreg.QueryValueEx(sub_key, "DisplayVersion")[0]
-                except EnvironmentError:
-                    software['version'] = 'undefined'
+                    sub_key_name = winreg.EnumKey(reg_key, i)
+                except OSError:
+                    break
+                i += 1
+
                 try:
-                    software['publisher'] = winreg.QueryValueEx(sub_key, "Publisher")[0]
-                except EnvironmentError:
-                    software['publisher'] = 'undefined'
-                software_list.append(software)
-            except EnvironmentError:
-                continue
+                    with winreg.OpenKey(reg_key, sub_key_name) as sub_key:
+                        # Enumerate every value under the subkey in one sweep
+                        # rather than issuing a QueryValueEx round-trip per field.
+                        values = {}
+                        for j in range(winreg.QueryInfoKey(sub_key)[1]):
+                            value_name, value, _ = winreg.EnumValue(sub_key, j)
+                            values[value_name] = value
+                except OSError:
+                    continue
+
+                name = values.get("DisplayName")
+                if not name:
+                    continue
+
+                software_list.append({
+                    'name': name,
+                    'version': values.get("DisplayVersion", 'undefined'),
+                    'publisher': values.get("Publisher", 'undefined')
+                })
 
         return software_list
     except Exception as e:
@@ -83,41 +224,23 @@ def get_software(hive, flag) -> list:
 
 def get_memory() -> list:
     """
-    Retrieves memory (RAM) information using WMIC.
+    Retrieves memory (RAM) information from the batched CIM collection.
 
     Returns:
         list: A list of dictionaries, each containing memory chip details.
     """
 
     try:
-        wmic = subprocess.check_output(
-            'wmic memorychip get DeviceLocator, Capacity, ConfiguredClockSpeed, DataWidth, Manufacturer, PartNumber'
-        )
-
-        memory = str(wmic, 'utf-8').split()
-
         devices = []
-        multi = 1
-        offset = 6
-        num_devices = round(len(memory[offset:]) / offset)
-        for d in range(num_devices):
-            output = {}
-            for o in range(offset):
-                output[to_snake_case(memory[o])] = ''
-
-            if d != 0 and d % 1 == 0:
-                multi = multi + 1
-            values = memory[offset * multi:]
-            for v in range(offset):
-                key = to_snake_case(memory[v])
-                if key in ['capacity', 'configured_clock_speed', 'data_width']:
-                    value = int(values[v])
-                    if key == 'capacity': value = round(int(values[v]) / (1024.0 ** 3))
-                else:
-                    value = values[v]
-                output[key] = value
-
-            devices.append(output)
+        for chip in _cim_instances('memory'):
+            devices.append({
+                'device_locator': chip.get('DeviceLocator'),
+                'capacity': round(int(chip.get('Capacity') or 0) / (1024.0 ** 3)),
+                'configured_clock_speed': chip.get('ConfiguredClockSpeed'),
+                'data_width': chip.get('DataWidth'),
+                'manufacturer': chip.get('Manufacturer'),
+                'part_number': (chip.get('PartNumber') or '').strip()
+            })
 
         return devices
     except Exception as e:
@@ -127,38 +250,23 @@ def get_memory() -> list:
 
 def get_disks() -> list:
     """
-    Retrieves disk information using WMIC.
+    Retrieves disk information from the batched CIM collection.
 
     Returns:
         list: A list of dictionaries, each containing disk details.
     """
 
     try:
-        wmic = subprocess.check_output(
-            'wmic diskdrive get Model, Size, MediaType, SerialNumber, Status', shell=True
-        )
-        disk_info = str(wmic, 'utf-8').strip().split('\n')
         disks = []
-        
-        for disk in disk_info[1:]:
-            parts = [p.strip() for p in disk.split() if p]
-            
-            if len(parts) >= 5:
-                model = ' '.join(parts[:-4])
-                size = parts[-2]
-                try:
-                    size = int(size) // (1024**3)
-                except ValueError:
-                    size = parts[-2]
-                
-                disks.append({
-                    'model': model,
-                    'size_gb': size,
-                    'media_type': parts[-5],
-                    'serial_number': parts[-4],
-                    'status': parts[-1]
-                })
-        
+        for disk in _cim_instances('disks'):
+            disks.append({
+                'model': disk.get('Model'),
+                'size_gb': int(disk.get('Size') or 0) // (1024 ** 3),
+                'media_type': disk.get('MediaType'),
+                'serial_number': (disk.get('SerialNumber') or '').strip(),
+                'status': disk.get('Status')
+            })
+
         return disks
     except Exception as e:
         print_error(f"Failed to get disk information: {e}")
@@ -167,24 +275,20 @@ def get_disks() -> list:
 
 def get_gpus() -> list:
     """
-    Retrieves GPU information using WMIC.
+    Retrieves GPU information from the batched CIM collection.
 
     Returns:
         list: A list of dictionaries, each containing GPU details.
     """
 
     try:
-        wmic = subprocess.check_output('wmic path win32_VideoController get Name, DriverVersion, Status', shell=True)
-        gpu_info = str(wmic, 'utf-8').strip().split('\n')[1:]
         gpus = []
-        for gpu in gpu_info:
-            parts = [p.strip() for p in gpu.split('  ') if p]
-            if len(parts) == 3:
-                gpus.append({
-                    'name': parts[1],
-                    'driver_version': parts[0],
-                    'status': parts[2]
-                })
+        for gpu in _cim_instances('gpus'):
+            gpus.append({
+                'name': gpu.get('Name'),
+                'driver_version': gpu.get('DriverVersion'),
+                'status': gpu.get('Status')
+            })
 
         return gpus
     except Exception as e:
@@ -194,114 +298,412 @@ def get_gpus() -> list:
 
 def get_network_interfaces() -> list:
     """
-    Retrieves network interface information using WMIC.
+    Retrieves network interface information from the batched CIM collection.
 
     Returns:
         list: A list of dictionaries, each containing network interface details.
     """
 
     try:
-        wmic = subprocess.check_output('wmic nic get Name, MACAddress, Speed, Manufacturer, Description', shell=True)
-        lines = str(wmic, 'utf-8').strip().split('\n')
-        
-        headers = re.split(r'\s{2,}', lines[0].strip())
-        headers = [header.strip().lower().replace(' ', '_') for header in headers]
-        
-        network_info = lines[1:]
         interfaces = []
+        for nic in _cim_instances('nics'):
+            interfaces.append({
+                'description': nic.get('Description') or '',
+                'macaddress': nic.get('MACAddress') or '',
+                'manufacturer': nic.get('Manufacturer') or '',
+                'name': nic.get('Name') or '',
+                'speed': str(nic.get('Speed')) if nic.get('Speed') is not None else ''
+            })
 
-        for line in network_info:
-            parts = re.split(r'\s{2,}', line.strip())
-            interface = {}
-            
-            if len(parts) == 3:
-                # Case where there are three values: description, manufacturer, name
-                interface['description'] = parts[0]
-                interface['manufacturer'] = parts[1]
-                interface['name'] = parts[2]
-            else:
-                # Case where there are five values
-                for idx, header in enumerate(headers):
-                    if idx < len(parts):
-                        interface[header] = parts[idx]
-                    else:
-                        interface[header] = ''
-            
-            interfaces.append(interface)
-        
         return interfaces
     except Exception as e:
         print_error(f"Failed to get network information: {e}")
         return []
 
 
+# netsh interface fields kept in the Wi-Fi details; a frozenset gives
+# O(1) membership checks and is built once at import.
+_WIFI_INCLUDE_KEYS = frozenset({
+    'authentication',
+    'band',
+    'bssid',
+    'channel',
+    'description',
+    'guid',
+    'physical_address',
+    'radio_type',
+    'ssid',
+    'state',
+    'receive_rate_(mbps)',
+    'transmit_rate_(mbps)',
+})
+
+# wlanapi constants and structures for the in-process Wi-Fi query.
+_WLAN_API_VERSION = 2
+_WLAN_INTF_OPCODE_CURRENT_CONNECTION = 7
+_WLAN_INTF_OPCODE_CHANNEL_NUMBER = 8
+_WLAN_PROFILE_GET_PLAINTEXT_KEY = 4
+_WLAN_INTERFACE_STATE_CONNECTED = 1
+_WLAN_PROFILE_XML_NS = '{http://www.microsoft.com/networking/WLAN/profile/v1}'
+
+# dot11 enum values mapped onto the strings netsh reports, so the output
+# matches whichever path produced it.
+_DOT11_PHY_TYPES = {
+    4: '802.11a',
+    5: '802.11b',
+    6: '802.11g',
+    7: '802.11n',
+    8: '802.11ac',
+    9: '802.11ad',
+    10: '802.11ax',
+}
+
+_DOT11_AUTH_ALGORITHMS = {
+    1: 'Open',
+    2: 'Shared',
+    3: 'WPA-Enterprise',
+    4: 'WPA-Personal',
+    5: 'WPA-None',
+    6: 'WPA2-Enterprise',
+    7: 'WPA2-Personal',
+    8: 'WPA3-Enterprise',
+    9: 'WPA3-Personal',
+}
+
+
+class _GUID(ctypes.Structure):
+    _fields_ = [
+        ('Data1', ctypes.c_ulong),
+        ('Data2', ctypes.c_ushort),
+        ('Data3', ctypes.c_ushort),
+        ('Data4', ctypes.c_ubyte * 8),
+    ]
+
+
+class _DOT11_SSID(ctypes.Structure):
+    _fields_ = [
+        ('uSSIDLength', ctypes.c_ulong),
+        ('ucSSID', ctypes.c_char * 32),
+    ]
+
+
+class _WLAN_INTERFACE_INFO(ctypes.Structure):
+    _fields_ = [
+        ('InterfaceGuid', _GUID),
+        ('strInterfaceDescription', ctypes.c_wchar * 256),
+        ('isState', ctypes.c_uint),
+    ]
+
+
+class _WLAN_INTERFACE_INFO_LIST(ctypes.Structure):
+    _fields_ = [
+        ('dwNumberOfItems', ctypes.c_ulong),
+        ('dwIndex', ctypes.c_ulong),
+        ('InterfaceInfo', _WLAN_INTERFACE_INFO * 1),
+    ]
+
+
+class _WLAN_ASSOCIATION_ATTRIBUTES(ctypes.Structure):
+    _fields_ = [
+        ('dot11Ssid', _DOT11_SSID),
+        ('dot11BssType', ctypes.c_uint),
+        ('dot11Bssid', ctypes.c_ubyte * 6),
+        ('dot11PhyType', ctypes.c_uint),
+        ('uDot11PhyIndex', ctypes.c_ulong),
+        ('wlanSignalQuality', ctypes.c_ulong),
+        ('ulRxRate', ctypes.c_ulong),
+        ('ulTxRate', ctypes.c_ulong),
+    ]
+
+
+class _WLAN_SECURITY_ATTRIBUTES(ctypes.Structure):
+    _fields_ = [
+        ('bSecurityEnabled', ctypes.c_int),
+        ('bOneXEnabled', ctypes.c_int),
+        ('dot11AuthAlgorithm', ctypes.c_uint),
+        ('dot11CipherAlgorithm', ctypes.c_uint),
+    ]
+
+
+class _WLAN_CONNECTION_ATTRIBUTES(ctypes.Structure):
+    _fields_ = [
+        ('isState', ctypes.c_uint),
+        ('wlanConnectionMode', ctypes.c_uint),
+        ('strProfileName', ctypes.c_wchar * 256),
+        ('wlanAssociationAttributes', _WLAN_ASSOCIATION_ATTRIBUTES),
+        ('wlanSecurityAttributes', _WLAN_SECURITY_ATTRIBUTES),
+    ]
+
+
+def _guid_str(guid: _GUID) -> str:
+    """
+    Formats a GUID structure the way netsh prints interface GUIDs.
+
+    Args:
+        guid (_GUID): The GUID structure to format.
+
+    Returns:
+        str: The lowercase hyphenated GUID string.
+    """
+
+    return '{:08x}-{:04x}-{:04x}-{}-{}'.format(
+        guid.Data1, guid.Data2, guid.Data3,
+        bytes(guid.Data4[:2]).hex(), bytes(guid.Data4[2:]).hex()
+    )
+
+
+def _get_wifi_via_wlanapi() -> dict:
+    """
+    Retrieves the current Wi-Fi connection details directly from wlanapi.dll.
+
+    WlanQueryInterface and WlanGetProfile return the same data netsh prints
+    (including the plaintext key) without spawning any subprocesses or
+    parsing human-readable text, so the whole query completes in a few
+    milliseconds in-process.
+
+    Returns:
+        dict: A dictionary of Wi-Fi connection details, or None if no
+              wireless interface is connected.
+
+    Raises:
+        Exception: If the wlanapi calls fail; the caller falls back to netsh.
+    """
+
+    wlanapi = ctypes.windll.wlanapi
+    negotiated = ctypes.c_ulong()
+    handle = ctypes.c_void_p()
+    if wlanapi.WlanOpenHandle(_WLAN_API_VERSION, None,
+                              ctypes.byref(negotiated), ctypes.byref(handle)):
+        raise OSError("WlanOpenHandle failed")
+
+    try:
+        p_iface_list = ctypes.POINTER(_WLAN_INTERFACE_INFO_LIST)()
+        if wlanapi.WlanEnumInterfaces(handle, None, ctypes.byref(p_iface_list)):
+            raise OSError("WlanEnumInterfaces failed")
+
+        try:
+            iface_list = p_iface_list.contents
+            interfaces = ctypes.cast(
+                iface_list.InterfaceInfo,
+                ctypes.POINTER(_WLAN_INTERFACE_INFO * iface_list.dwNumberOfItems)
+            ).contents
+
+            for iface in interfaces:
+                if iface.isState != _WLAN_INTERFACE_STATE_CONNECTED:
+                    continue
+
+                data_size = ctypes.c_ulong()
+                p_data = ctypes.c_void_p()
+                if wlanapi.WlanQueryInterface(
+                        handle, ctypes.byref(iface.InterfaceGuid),
+                        _WLAN_INTF_OPCODE_CURRENT_CONNECTION, None,
+                        ctypes.byref(data_size), ctypes.byref(p_data), None):
+                    continue
+
+                try:
+                    conn = ctypes.cast(p_data, ctypes.POINTER(_WLAN_CONNECTION_ATTRIBUTES)).contents
+                    assoc = conn.wlanAssociationAttributes
+                    security = conn.wlanSecurityAttributes
+                    profile_name = conn.strProfileName
+
+                    wifi_details = {
+                        'authentication': _DOT11_AUTH_ALGORITHMS.get(
+                            security.dot11AuthAlgorithm, str(security.dot11AuthAlgorithm)),
+                        'bssid': ':'.join(f'{b:02x}' for b in assoc.dot11Bssid),
+                        'description': iface.strInterfaceDescription,
+                        'guid': _guid_str(iface.InterfaceGuid),
+                        'radio_type': _DOT11_PHY_TYPES.get(
+                            assoc.dot11PhyType, str(assoc.dot11PhyType)),
+                        'ssid': assoc.dot11Ssid.ucSSID[:assoc.dot11Ssid.uSSIDLength].decode(
+                            'utf-8', 'replace'),
+                        'state': 'connected',
+                        'receive_rate_(mbps)': str(assoc.ulRxRate // 1000),
+                        'transmit_rate_(mbps)': str(assoc.ulTxRate // 1000),
+                    }
+                finally:
+                    wlanapi.WlanFreeMemory(p_data)
+
+                # The adapter's own MAC is not part of the connection
+                # attributes; the cached CIM NIC list carries it under the
+                # same description string netsh prints.
+                try:
+                    for nic in _cim_instances('nics'):
+                        if nic.get('Description') == wifi_details['description']:
+                            mac = (nic.get('MACAddress') or '').lower()
+                            if mac:
+                                wifi_details['physical_address'] = mac
+                            break
+                except Exception:
+                    pass
+
+                p_channel = ctypes.c_void_p()
+                if not wlanapi.WlanQueryInterface(
+                        handle, ctypes.byref(iface.InterfaceGuid),
+                        _WLAN_INTF_OPCODE_CHANNEL_NUMBER, None,
+                        ctypes.byref(data_size), ctypes.byref(p_channel), None):
+                    try:
+                        channel = ctypes.cast(
+                            p_channel, ctypes.POINTER(ctypes.c_ulong)).contents.value
+                        wifi_details['channel'] = str(channel)
+                        # Channels 1-14 live in the 2.4 GHz band; netsh
+                        # reports everything above that as 5 GHz.
+                        wifi_details['band'] = '2.4 GHz' if channel <= 14 else '5 GHz'
+                    finally:
+                        wlanapi.WlanFreeMemory(p_channel)
+
+                # The profile XML carries the key when queried with the
+                # plaintext-key flag; the document is tiny, so ElementTree
+                # parses it in microseconds.
+                p_xml = ctypes.c_wchar_p()
+                flags = ctypes.c_ulong(_WLAN_PROFILE_GET_PLAINTEXT_KEY)
+                access = ctypes.c_ulong()
+                if not wlanapi.WlanGetProfile(
+                        handle, ctypes.byref(iface.InterfaceGuid), profile_name,
+                        None, ctypes.byref(p_xml), ctypes.byref(flags), ctypes.byref(access)):
+                    try:
+                        root = xml.etree.ElementTree.fromstring(p_xml.value)
+                        key = root.find(f'.//{_WLAN_PROFILE_XML_NS}keyMaterial')
+                        if key is not None and key.text:
+                            wifi_details['password'] = key.text
+                    finally:
+                        wlanapi.WlanFreeMemory(p_xml)
+
+                return wifi_details
+        finally:
+            wlanapi.WlanFreeMemory(p_iface_list)
+
+        return None
+    finally:
+        wlanapi.WlanCloseHandle(handle, None)
+
+
 def get_connected_wifi() -> dict:
     """
-    Retrieves information about the currently connected Wi-Fi network using netsh.
+    Retrieves information about the currently connected Wi-Fi network.
+
+    The details are queried in-process through wlanapi.dll, which replaces
+    the two netsh subprocess launches with direct DLL calls; netsh remains
+    as a fallback for environments where the WLAN service refuses the query.
 
     Returns:
         dict: A dictionary containing Wi-Fi connection details, including the password.
     """
 
     try:
-        wifi_info = subprocess.check_output('netsh wlan show interfaces', shell=True)
-        wifi_info = str(wifi_info, 'utf-8').strip().split('\n')
-
-        include_keys = [
-            'authentication',
-            'band',
-            'bssid',
-            'channel',
-            'description',
-            'guid',
-            'physical_address',
-            'radio_type',
-            'ssid',
-            'state',
-            'receive_rate_(mbps)',
-            'transmit_rate_(mbps)'
-        ]
-        
+        wifi_details = _get_wifi_via_wlanapi()
+        return wifi_details if wifi_details is not None else {}
+    except Exception:
+        pass
+
+    try:
         wifi_details = {}
         ssid = None
-        for line in wifi_info:
-            if ':' in line:
+        # An argv list spawns netsh directly instead of wrapping it in
+        # cmd.exe, halving the process creations for each fallback call.
+        with subprocess.Popen(['netsh', 'wlan', 'show', 'interfaces'],
+                              stdout=subprocess.PIPE, text=True,
+                              creationflags=subprocess.CREATE_NO_WINDOW) as process:
+            # Iterate stdout as it arrives instead of materializing the
+            # whole output, decoding it, and splitting it into a list.
+            for line in process.stdout:
+                if ':' not in line:
+                    continue
                 key, value = line.split(':', 1)
                 key = key.strip().lower().replace(' ', '_')
                 value = value.strip()
-                if key in include_keys:
+                if key in _WIFI_INCLUDE_KEYS:
                     wifi_details[key] = value
                 if key == 'ssid':
                     ssid = value
-        
+
         if ssid:
-            profile_info = subprocess.check_output(f'netsh wlan show profile name="{ssid}" key=clear', shell=True)
-            profile_info = str(profile_info, 'utf-8').strip().split('\n')
-            for line in profile_info:
-                if 'Key Content' in line:
-                    key, value = line.split(':', 1)
-                    wifi_details['password'] = value.strip()
-                    break
-        
+            with subprocess.Popen(['netsh', 'wlan', 'show', 'profile', f'name={ssid}', 'key=clear'],
+                                  stdout=subprocess.PIPE, text=True,
+                                  creationflags=subprocess.CREATE_NO_WINDOW) as process:
+                for line in process.stdout:
+                    if 'Key Content' in line:
+                        key, value = line.split(':', 1)
+                        wifi_details['password'] = value.strip()
+                        # The needed line was found; stop consuming output.
+                        process.terminate()
+                        break
+
         return wifi_details
     except Exception as e:
         print_error(f"Failed to get connected Wi-Fi information: {e}")
         return {}
 
 
+@functools.lru_cache(maxsize=1)
+def get_cpu() -> dict:
+    """
+    Retrieves CPU information from the registry and the kernel.
+
+    The marketing name is read straight from the CentralProcessor registry
+    key (the same source platform.processor() consults, minus its extra
+    environment lookups), and GetLogicalProcessorInformationEx counts
+    physical cores — os.cpu_count() only reports logical processors, which
+    double-counts SMT siblings.
+
+    Returns:
+        dict: A dictionary containing the CPU name, physical core count,
+              and logical processor count.
+    """
+
+    try:
+        reg_key = open_reg_key(
+            winreg.HKEY_LOCAL_MACHINE, r"HARDWARE\DESCRIPTION\System\CentralProcessor\0")
+        name = winreg.QueryValueEx(reg_key, "ProcessorNameString")[0].strip()
+    except Exception as e:
+        print_error(f"Failed to get CPU name: {e}")
+        name = "N/A"
+
+    cores = None
+    try:
+        # RelationProcessorCore (0) returns one record per physical core.
+        # The first call reports the required buffer size; each record
+        # starts with a Relationship DWORD followed by a Size DWORD.
+        kernel32 = ctypes.windll.kernel32
+        length = ctypes.c_ulong(0)
+        kernel32.GetLogicalProcessorInformationEx(0, None, ctypes.byref(length))
+        buffer = ctypes.create_string_buffer(length.value)
+        if kernel32.GetLogicalProcessorInformationEx(0, buffer, ctypes.byref(length)):
+            data = buffer.raw
+            cores = 0
+            offset = 0
+            while offset + 8 <= length.value:
+                record_size = int.from_bytes(data[offset + 4:offset + 8], 'little')
+                if record_size <= 0:
+                    break
+                cores += 1
+                offset += record_size
+    except Exception as e:
+        print_error(f"Failed to count physical cores: {e}")
+
+    return {
+        'name': name,
+        'cores': cores or os.cpu_count(),
+        'logical_processors': os.cpu_count()
+    }
+
+
+@functools.lru_cache(maxsize=1)
 def get_distribution() -> str:
     """
-    Retrieves the operating system distribution name.
+    Retrieves the operating system distribution name from the Windows registry.
+
+    The same string systeminfo reports as "OS Name" lives in the
+    CurrentVersion key as ProductName; reading it directly replaces a
+    multi-second subprocess with a single registry query.
 
     Returns:
         str: The OS distribution name.
     """
 
     try:
-        os = subprocess.Popen('systeminfo', stdout=subprocess.PIPE).communicate()[0]
-        distro = str(os, "latin-1")
+        reg_key = open_reg_key(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows NT\CurrentVersion")
 
-        return re.search("OS Name:\s*(.*)", distro).group(1).strip()
+        return winreg.QueryValueEx(reg_key, "ProductName")[0]
     except Exception as e:
         print_error(f"Failed to get distribution information: {e}")
         return "N/A"
@@ -318,24 +720,27 @@ def get_uptime() -> str:
 
     try:
         uptime_ms = ctypes.windll.kernel32.GetTickCount64()
-        total_seconds = uptime_ms / 1000.0
+        # Integer divmod all the way down: no float rounding at unit
+        # boundaries and no casts when formatting.
+        total_seconds = uptime_ms // 1000
         days, remainder = divmod(total_seconds, 86400)
         hours, remainder = divmod(remainder, 3600)
         minutes, seconds = divmod(remainder, 60)
 
         uptime_parts = [
-            f"{int(days)} day{'s' if days != 1 else ''}" if days else "",
-            f"{int(hours)} hr{'s' if hours != 1 else ''}" if hours else "",
-            f"{int(minutes)} min{'s' if minutes != 1 else ''}" if minutes else "",
-            f"{int(seconds)} sec{'s' if seconds != 1 else ''}" if seconds else ""
+            (days, 'day'),
+            (hours, 'hr'),
+            (minutes, 'min'),
+            (seconds, 'sec')
         ]
 
-        return ", ".join(part for part in uptime_parts if part)
+        return ", ".join(f"{n} {unit}{'s' if n != 1 else ''}" for n, unit in uptime_parts if n)
     except Exception as e:
         print_error(f"Failed to get system uptime: {e}")
         return "N/A"
 
 
+@functools.lru_cache(maxsize=1)
 def get_user() -> str:
     """
     Retrieves the full username in the format 'DOMAIN\\username' or 'MACHINE\\username'.
@@ -358,16 +763,80 @@ def get_user() -> str:
         return "N/A"
 
 
+def _get_smbios_uuid() -> str:
+    """
+    Reads the system UUID directly from the SMBIOS firmware table.
+
+    GetSystemFirmwareTable copies the raw SMBIOS data out of the kernel with
+    no WMI involvement, so this avoids the CIM collection entirely when only
+    the HWID is needed. The UUID lives at offset 8 of the Type 1 (System
+    Information) structure.
+
+    Returns:
+        str: The system UUID formatted as an uppercase GUID, or None if the
+             firmware table is unavailable or the UUID is not populated.
+    """
+
+    RSMB = 0x52534D42  # 'RSMB' provider signature
+
+    kernel32 = ctypes.windll.kernel32
+    size = kernel32.GetSystemFirmwareTable(RSMB, 0, None, 0)
+    if not size:
+        return None
+
+    buffer = ctypes.create_string_buffer(size)
+    if kernel32.GetSystemFirmwareTable(RSMB, 0, buffer, size) != size:
+        return None
+
+    # Skip the 8-byte RawSMBIOSData header, then walk the structures: each
+    # has a 4-byte header, a formatted area of `length` bytes, and a string
+    # set terminated by a double null.
+    data = buffer.raw
+    offset = 8
+    end = len(data)
+    while offset + 4 <= end:
+        struct_type = data[offset]
+        length = data[offset + 1]
+        if length < 4:
+            break
+
+        if struct_type == 1 and length >= 24:
+            uuid_bytes = data[offset + 8:offset + 24]
+            # All-zero and all-0xFF mean the UUID is not set.
+            if uuid_bytes.strip(b'\x00') and uuid_bytes.strip(b'\xff'):
+                return str(uuid.UUID(bytes_le=uuid_bytes)).upper()
+
+        next_offset = offset + length
+        while next_offset + 1 < end and data[next_offset:next_offset + 2] != b'\x00\x00':
+            next_offset += 1
+        offset = next_offset + 2
+
+    return None
+
+
+@functools.lru_cache(maxsize=1)
 def get_hwid() -> str:
     """
     Retrieves the hardware ID (HWID) and generates a SHA-256 hash.
 
+    The UUID is read from the SMBIOS firmware table when possible, falling
+    back to the batched CIM collection. hashlib dispatches to the
+    interpreter's OpenSSL build, which uses the SHA-NI instructions
+    automatically on CPUs that support them; official CPython Windows
+    installers ship such a build, so no extra dependency is needed for
+    hardware-accelerated hashing.
+
     Returns:
         str: The SHA-256 hash of the HWID.
     """
 
     try:
-        id = str(subprocess.check_output('wmic csproduct get uuid'), 'utf-8').split('\n')[1].strip()
+        id = _get_smbios_uuid()
+        if not id:
+            product = _cim_instances('product')
+            id = product[0].get('UUID') if product else None
+        if not id:
+            raise ValueError("no system UUID available")
         return hashlib.sha256(id.encode('utf-8')).hexdigest()
     except Exception as e:
         print_error(f"Failed to get HWID: {e}")
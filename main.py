@@ -1,28 +1,55 @@
 import argparse
-import logging
-import json
 import msvcrt
-from app.auth_handler import get_access_token
-from app.profile_handler import get_profile, write_profile, send_profile
+import threading
+from app.auth_handler import get_access_token, prefetch_tokens
+from app.profile_handler import get_profile, serialize_profile, write_profile, send_profile, \
+    profile_unchanged, remember_profile_hash
 from app.output_handler import print_info, print_error
 
-logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 
+def _send_in_background(access_token: str, payload: bytes, profile: dict) -> None:
+    """
+    Uploads the device profile from the background thread.
+
+    send_profile reports failures through print_error before re-raising;
+    the exception is swallowed here so a failed upload ends with that
+    one-line error instead of the default thread excepthook dumping a
+    traceback. The profile digest is recorded only once the service has
+    accepted the upload, so a failed send is retried on the next run.
+
+    Args:
+        access_token (str): The access token for the prospector service.
+        payload (bytes): The compact serialized device profile.
+        profile (dict): The device profile, for digest recording on success.
+    """
 
-def run_prospector(send_to_service: bool) -> dict:
+    try:
+        send_profile(access_token, payload)
+    except Exception:
+        return
+
+    remember_profile_hash(profile)
+
+
+def run_prospector(send_to_service: bool, force: bool = False) -> tuple:
     """
     Collects device profile information, writes it to a file, and optionally sends it to the prospector service.
 
     This function gathers comprehensive information about the device, including hardware, software, and OS details.
-    It then writes this information to a JSON file. If the `send_to_service` flag is set to True, it retrieves an 
+    It then writes this information to a JSON file. If the `send_to_service` flag is set to True, it retrieves an
     access token and sends the profile to the prospector service.
 
     Args:
         send_to_service (bool): A flag indicating whether to send the device profile to the prospector service.
+        force (bool): A flag indicating whether to rescan everything, ignoring a recent cached profile.
 
     Returns:
-        dict: A dictionary containing the collected device profile. If an error occurs during the collection process,
-              an empty dictionary is returned.
+        tuple: The collected device profile dict, its pretty-printed JSON
+               bytes (serialized once and shared between the profile file and
+               the interactive print), and the background upload thread (or
+               None when nothing was sent), which the caller must join before
+               exiting. If an error occurs during the collection process, an
+               empty dict, empty bytes, and None are returned.
 
     Raises:
         Exception: If there is an unexpected error during the profile collection or sending process. The error is 
@@ -32,28 +59,46 @@ def run_prospector(send_to_service: bool) -> dict:
     print_info("Collecting device profile...")
 
     try:
-        profile = get_profile()
-        write_profile(profile)
+        if send_to_service:
+            prefetch_tokens()
+        profile = get_profile(force)
+        pretty_payload = serialize_profile(profile, pretty=True)
+        # A rerun on an unchanged device has nothing new to persist or
+        # upload; the stored digest makes that case free.
+        if not force and profile_unchanged(profile):
+            print_info("Device profile unchanged since last run. Skipping write and send.")
+            return profile, pretty_payload, None
+        send_thread = None
         if send_to_service:
             access_token = get_access_token()
-            send_profile(access_token, profile)
-        return profile
+            # The upload runs in the background so it overlaps the file
+            # write and the interactive prompt instead of blocking them;
+            # the caller joins the thread before the process exits.
+            send_thread = threading.Thread(
+                target=_send_in_background,
+                args=(access_token, serialize_profile(profile), profile))
+            send_thread.start()
+        write_profile(pretty_payload, profile['hwid'])
+        return profile, pretty_payload, send_thread
     except Exception as e:
         print_error(f"Failed to collect device profile: {e}")
-        return {}
+        return {}, b'', None
 
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description="Collect and send prospector device profiles for Windows.")
     parser.add_argument('--silent', action="store_true", help="Run without user input (note: user must authenticate first).")
     parser.add_argument('--send', action="store_true", help="Send device profile to the prospector service.")
+    parser.add_argument('--force', action="store_true", help="Rescan everything, ignoring a recently cached profile.")
     args = parser.parse_args()
 
-    profile = run_prospector(args.send)
+    profile, pretty_payload, send_thread = run_prospector(args.send, args.force)
     if profile and not args.silent:
         print_info("Press 'p' to print device profile or any other key to exit...")
         key = msvcrt.getch()
         if key.lower() == b'p':
-            print(json.dumps(profile, indent=4))
+            print(pretty_payload.decode('utf-8'))
 
+    if send_thread is not None:
+        send_thread.join()
     print_info("Exiting...")
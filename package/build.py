@@ -46,9 +46,17 @@ def prepare_upx(pkg_dir: str, upx_ver: str) -> str:
         urllib.request.urlretrieve(upx_url, upx_path)
 
         with zipfile.ZipFile(upx_path, 'r') as zip_ref:
-            zip_ref.extractall(pkg_dir)
-                
+            # Verify the archive CRCs before extracting so a truncated or
+            # corrupted download fails here rather than mid-build.
+            corrupt = zip_ref.testzip()
+            if corrupt is None:
+                zip_ref.extractall(pkg_dir)
+
+        # Delete only after the ZipFile is closed; Windows refuses to
+        # remove a file that is still open.
         os.remove(upx_path)
+        if corrupt is not None:
+            raise RuntimeError(f"Downloaded UPX archive is corrupt: {corrupt}")
     else:
         print("UPX is available")
 